@@ -1,6 +1,6 @@
 # Generate Infographic
 import re
-import datetime
+import time
 import pathlib
 from typing import Dict, Tuple
 
@@ -9,19 +9,35 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 import json
 import io
 import html  # for escaping strings in clipboard button
+import functools
+import hashlib
 import streamlit.components.v1 as components
 import zipfile
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httplib2
+import google_auth_httplib2
 import os
 from google.oauth2 import service_account
 import urllib.parse
 from google_auth_oauthlib.flow import Flow
 
-print("Current working directory:", os.getcwd())
-print("Files in current directory:", os.listdir())
+from prompts import STEP4_PROMPT, step_prompts
+
+# Startup diagnostics; this script re-runs on every interaction, so only list
+# the working directory when explicitly asked to.
+if os.getenv("TUESDAY_DEBUG") == "1":
+    print("Current working directory:", os.getcwd())
+    print("Files in current directory:", os.listdir())
 
 # ---------------------------------------------------------------------------
 # Streamlit rerun helper (must be defined early) ----------------------------
@@ -35,124 +51,283 @@ if "_rerun" not in globals():
         else:
             st.rerun()
 
+# ---------------------------------------------------------------------------
+# Google API request helper -------------------------------------------------
+# ---------------------------------------------------------------------------
+
+# googleapiclient retries 5xx and 429 responses with exponential backoff when
+# execute() is given num_retries, so every API call goes through _execute.
+_API_RETRIES = 5
+
+
+def _execute(request, num_retries: int = _API_RETRIES, **kwargs):
+    """Execute a googleapiclient *request* with retries on transient errors.
+
+    Service objects are shared between sessions (see get_drive_service), so
+    the request runs on a transport private to the calling thread rather than
+    the service's own httplib2.Http. Pass ``num_retries=0`` for calls that
+    are not safe to repeat.
+    """
+    kwargs.setdefault("http", _thread_http(request.http.credentials))
+    return request.execute(num_retries=num_retries, **kwargs)
+
 # ---------------------------------------------------------------------------
 # Utility to build slide thumbnails ZIP -------------------------------------
 # ---------------------------------------------------------------------------
 
+# Cap on concurrent thumbnail fetches; keeps us well inside the Slides API
+# per-user quota while still overlapping the per-slide round trips.
+_THUMBNAIL_WORKERS = 8
+
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """Return the shared HTTP session used for thumbnail downloads.
+
+    Keep-alive connections are pooled across slides and, because this script
+    is re-executed on every rerun, cached as a resource so they also survive
+    reruns. Transient 429/5xx responses are retried by urllib3.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=2 * _THUMBNAIL_WORKERS,
+            max_retries=Retry(
+                total=5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                backoff_factor=0.5,
+                allowed_methods=frozenset({"GET"}),
+            ),
+        ),
+    )
+    return session
+
+
+# Downloaded PNGs are spooled per slide until the ZIP writer reaches them;
+# anything larger than this goes to a temp file rather than staying in RAM.
+_THUMBNAIL_SPOOL_BYTES = 256 * 1024
+
+_THUMBNAIL_SIZES = ("LARGE", "MEDIUM", "SMALL")
+# getThumbnail statuses that mean the requested size could not be rendered.
+_THUMBNAIL_SIZE_ERRORS = frozenset({400, 413})
+
+_thread_state = threading.local()
+
+
+def _thread_http(creds: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Return an authorised httplib2 transport private to the calling thread.
+
+    httplib2 connections are not thread-safe, so worker threads must not share
+    the transport owned by a service object built on the main thread.
+    """
+    http = getattr(_thread_state, "http", None)
+    if http is None or http.credentials is not creds:
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+        _thread_state.http = http
+    return http
+
+
+def _fetch_slide_png(
+    session: requests.Session,
+    creds: Credentials,
+    slides_svc,
+    presentation_id: str,
+    slide_id: str,
+) -> tempfile.SpooledTemporaryFile:
+    """Download a single slide's PNG into a spool file (runs on a worker thread).
+
+    The body is streamed here in chunks, so the pooled connection goes back to
+    the session as soon as the download finishes, not when the ZIP writer gets
+    to it, and a finished slide waiting its turn never sits whole in memory.
+    The caller owns (and must close) the returned file.
+    """
+    # Request LARGE; only fall back to MEDIUM → SMALL when the API reports the
+    # size itself as the problem. Auth, permission and quota errors surface
+    # immediately.
+    for size in _THUMBNAIL_SIZES:
+        try:
+            # Transient 5xx/429 are retried at this size by _execute rather
+            # than dropping to a smaller thumbnail.
+            thumb = _execute(
+                slides_svc.presentations()
+                .pages()
+                .getThumbnail(
+                    presentationId=presentation_id,
+                    pageObjectId=slide_id,
+                    thumbnailProperties_thumbnailSize=size,
+                    thumbnailProperties_mimeType="PNG",
+                    fields="contentUrl",
+                ),
+            )
+            break
+        except HttpError as exc:
+            if exc.resp.status not in _THUMBNAIL_SIZE_ERRORS or size == _THUMBNAIL_SIZES[-1]:
+                raise
+
+    spool = tempfile.SpooledTemporaryFile(max_size=_THUMBNAIL_SPOOL_BYTES)
+    try:
+        with session.get(
+            thumb["contentUrl"],
+            headers={"Authorization": f"Bearer {creds.token}"},
+            timeout=30,
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def _write_slide_images_zip(
+    session: requests.Session,
+    creds: Credentials,
+    slides_svc,
+    presentation_id: str,
+    slide_ids: Tuple[str, ...],
+) -> bytes:
+    """Fetch every slide thumbnail and return the ZIP bytes."""
+    zip_buf = io.BytesIO()
+    with ThreadPoolExecutor(max_workers=_THUMBNAIL_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                _fetch_slide_png, session, creds, slides_svc, presentation_id, slide_id
+            )
+            for slide_id in slide_ids
+        ]
+        try:
+            with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_STORED) as zf:
+                for idx, future in enumerate(futures, 1):
+                    with future.result() as png, zf.open(f"slide_{idx:02d}.png", "w") as dst:
+                        shutil.copyfileobj(png, dst, 64 * 1024)
+        finally:
+            # On failure, skip slides not yet started and close any spools
+            # that were downloaded but never written.
+            pool.shutdown(cancel_futures=True)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+
+    return zip_buf.getvalue()
+
+
+# Whole ZIPs can run to ~10 MB, so keep only a handful, and not for long.
+@st.cache_data(show_spinner=False, max_entries=4, ttl=600)
+def _cached_slide_images_zip(
+    presentation_id: str,
+    revision_id: str,
+    slide_ids: Tuple[str, ...],
+    _session: requests.Session,
+    _creds: Credentials,
+    _slides_svc,
+) -> bytes:
+    """Cached _write_slide_images_zip for one revision of a presentation.
+
+    The Slides revision ID changes whenever the deck is edited, so repeat
+    downloads of an unchanged deck skip every thumbnail request.
+    """
+    return _write_slide_images_zip(_session, _creds, _slides_svc, presentation_id, slide_ids)
+
+
 def build_slide_images_zip(
     creds: Credentials, slides_svc, presentation_id: str
-) -> io.BytesIO:
-    """Return an in-memory ZIP containing PNGs for each slide."""
-    pres_meta = slides_svc.presentations().get(
-        presentationId=presentation_id, fields="slides.objectId"
-    ).execute()
-    slide_ids = [s["objectId"] for s in pres_meta.get("slides", [])]
+) -> bytes:
+    """Return the bytes of a ZIP containing PNGs for each slide.
 
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for idx, slide_id in enumerate(slide_ids, 1):
-            # Attempt LARGE → MEDIUM → SMALL thumbnail sizes
-            for size in ("LARGE", "MEDIUM", "SMALL"):
-                try:
-                    thumb = (
-                        slides_svc.presentations()
-                        .pages()
-                        .getThumbnail(
-                            presentationId=presentation_id,
-                            pageObjectId=slide_id,
-                            thumbnailProperties_thumbnailSize=size,
-                            thumbnailProperties_mimeType="PNG",
-                        )
-                        .execute()
-                    )
-                    img_url = thumb["contentUrl"]
-
-                    headers = {"Authorization": f"Bearer {creds.token}"}
-
-                    # Retry network fetch up to 3 times
-                    success = False
-                    for attempt in range(3):
-                        try:
-                            resp = requests.get(img_url, headers=headers, timeout=30)
-                            resp.raise_for_status()
-                            zf.writestr(f"slide_{idx:02d}.png", resp.content)
-                            success = True
-                            break
-                        except requests.exceptions.HTTPError as http_err:
-                            # Retry on server-side errors (>=500)
-                            if resp.status_code >= 500 and attempt < 2:
-                                continue
-                            else:
-                                raise http_err
-
-                    if success:
-                        break  # thumbnail saved, proceed to next slide
-                except Exception:
-                    # Try next size or raise after SMALL fails
-                    if size == "SMALL":
-                        raise
-                    continue
-
-    zip_buf.seek(0)
-    return zip_buf
+    Thumbnails are fetched concurrently; the ZIP itself is written on the
+    calling thread because ``ZipFile`` is not thread-safe. PNGs are already
+    DEFLATE-compressed, so they are stored as-is and copied into the archive
+    in 64 KiB chunks rather than being buffered whole.
+    """
+    # This call runs with the caller's credentials, so cached ZIPs are only
+    # served to users who can read the presentation.
+    pres_meta = _execute(
+        slides_svc.presentations().get(
+            presentationId=presentation_id, fields="revisionId,slides.objectId"
+        )
+    )
+    slide_ids = tuple(s["objectId"] for s in pres_meta.get("slides", []))
+
+    # Resolve the cached session here: st.cache_resource expects the script thread.
+    session = _http_session()
+
+    # revisionId is only returned to users with edit access; without it there
+    # is no safe cache key, so build the ZIP directly.
+    revision_id = pres_meta.get("revisionId")
+    if revision_id:
+        return _cached_slide_images_zip(
+            presentation_id, revision_id, slide_ids, session, creds, slides_svc
+        )
+    return _write_slide_images_zip(
+        session, creds, slides_svc, presentation_id, slide_ids
+    )
 
 # ---------------------------------------------------------------------------
 # Clipboard helper ----------------------------------------------------------
 # ---------------------------------------------------------------------------
 
 
-def clipboard_button(text: str, label: str = "Copy", key: str | None = None):
-    """Render an HTML/JS button that copies *text* to the browser clipboard.
+# Compact button styling. It has to ship with every snippet: components.html
+# renders in its own iframe, so page-level CSS never reaches the button.
+_COPY_BTN_CSS = (
+    ".copy-btn{background-color:#05F283!important;color:#002B56!important;"
+    "border:none;border-radius:.25rem;padding:.4rem .9rem;font-weight:600;"
+    "cursor:pointer;transition:background-color .2s ease}"
+    ".copy-btn:hover{background-color:#05c26a!important}"
+)
 
-    This works entirely client-side, so it does not require any server-side
-    clipboard library. The *key* ensures unique element IDs when the function
-    is used multiple times on the same page.
-    """
-    if key is None:
-        # Fallback to a simple hash for uniqueness
-        key = str(abs(hash(text)) % 10_000_000)
 
+@functools.lru_cache(maxsize=32)
+def _clipboard_html(text: str, label: str, key: str) -> str:
+    """Return the HTML/JS snippet for a copy button (cached across reruns)."""
     safe_text = html.escape(text)
     btn_id = f"btn_{key}"
     txt_id = f"txt_{key}"
 
-    # Inline JS copies the hidden textarea content to clipboard and gives UX
-    # feedback by temporarily changing the button label. Basic CSS makes it look
-    # close to Streamlit's default button style.
-    components.html(
-        f"""
-        <style>
-        .copy-btn {{
-            background-color: #05F283 !important;
-            color: #002B56 !important;
-            border: none;
-            border-radius: 0.25rem;
-            padding: 0.4rem 0.9rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: background-color 0.2s ease;
-        }}
-        .copy-btn:hover {{
-            background-color: #05c26a !important;
-        }}
-        </style>
-        <textarea id='{txt_id}' style='position:absolute; left:-1000px; top:-1000px;'>{safe_text}</textarea>
-        <button class='copy-btn' id='{btn_id}'>{label}</button>
-        <script>
+    # Inline JS copies the hidden textarea content with the Clipboard API
+    # (falling back to execCommand where it is unavailable) and gives UX
+    # feedback by temporarily changing the button label.
+    return (
+        f"<style>{_COPY_BTN_CSS}</style>"
+        f"<textarea id='{txt_id}' style='position:absolute;left:-1000px;top:-1000px;'>{safe_text}</textarea>"
+        f"<button class='copy-btn' id='{btn_id}'>{label}</button>"
+        f"""<script>
         const btn = document.getElementById('{btn_id}');
-        btn.addEventListener('click', () => {{
+        btn.addEventListener('click', async () => {{
             const txt = document.getElementById('{txt_id}');
-            txt.select();
-            document.execCommand('copy');
+            try {{
+                await navigator.clipboard.writeText(txt.value);
+            }} catch (err) {{
+                txt.select();
+                document.execCommand('copy');
+            }}
             const original = btn.innerText;
             btn.innerText = '✔ Copied!';
             setTimeout(() => btn.innerText = original, 2000);
         }});
-        </script>
-        """,
-        height=40,
+        </script>"""
     )
 
+
+def clipboard_button(text: str, label: str = "Copy", key: str | None = None):
+    """Render an HTML/JS button that copies *text* to the browser clipboard.
+
+    This works entirely client-side, so it does not require any server-side
+    clipboard library. The *key* ensures unique element IDs when the function
+    is used multiple times on the same page.
+    """
+    if key is None:
+        # Fallback to a content hash; unlike hash(), it is stable across
+        # processes, so element IDs don't change between reruns.
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=6).hexdigest()
+
+    components.html(_clipboard_html(text, label, key), height=40)
+
 # ---------------------------------------------------------------------------
 # Configuration --------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -182,7 +357,7 @@ DESTINATION_FOLDER_ID: str = _os.getenv("DESTINATION_FOLDER_ID", "1y-f2hHLl102Wj
 # The placeholders we expect in the template deck.  These keys are parsed from
 # the user-supplied text and then sent to the Google Slides API in a single
 # batchUpdate request.
-TEMPLATE_PLACEHOLDERS = [
+TEMPLATE_PLACEHOLDERS = (
     "{{Title}}",
     "{{Subtitle}}",
     "{{Lesson 1 Title}}",
@@ -235,7 +410,23 @@ TEMPLATE_PLACEHOLDERS = [
     "{{Lesson 4 Case Description}}",
     "{{Activity Title}}",
     "{{Activity Instructions}}",
-]
+)
+
+# replaceAllText request skeletons, built once in template order.  Only the
+# replacement text varies between decks, so replace_placeholders just fills it in.
+_REPLACE_REQUEST_TEMPLATE = tuple(
+    {"replaceAllText": {"containsText": {"text": ph, "matchCase": True}}}
+    for ph in TEMPLATE_PLACEHOLDERS
+)
+
+# Compiled once for parse_user_content; the set gives O(1) placeholder lookups.
+_PLACEHOLDER_LINE_RE = re.compile(
+    r"^[^\S\n]*\{+[^\S\n]*(?P<key>[^}\n]+?)[^\S\n]*\}+[^\S\n]*(?P<val>.*)$",
+    re.MULTILINE,
+)
+_NEXT_LINE_RE = re.compile(r"^[^\S\n]*(\S.*)$", re.MULTILINE)
+_PLACEHOLDERS_SET = frozenset(TEMPLATE_PLACEHOLDERS)
+_PLACEHOLDER_INDEX = {ph: i for i, ph in enumerate(TEMPLATE_PLACEHOLDERS)}
 
 SCOPES = [
     "https://www.googleapis.com/auth/drive",
@@ -258,6 +449,12 @@ def get_credentials() -> Credentials:
 
     token_path = pathlib.Path("google_token.json")
 
+    # Reuse the Credentials object from earlier in this session while it is
+    # still valid, so reruns skip re-reading (and re-writing) the token file.
+    cached = st.session_state.get("google_creds_obj")
+    if cached is not None and cached.valid:
+        return cached
+
     # ------------------------------------------------------------------
     # 1️⃣  Attempt to load credentials from disk first -----------------
     # ------------------------------------------------------------------
@@ -271,6 +468,7 @@ def get_credentials() -> Credentials:
                 st.session_state["google_creds"] = json.loads(creds.to_json())
                 # Persist any refreshed token back to disk
                 token_path.write_text(creds.to_json())
+                st.session_state["google_creds_obj"] = creds
                 return creds
         except Exception as e:
             print(f"Stored token invalid or unreadable: {e}. It will be ignored and a new auth flow will start.")
@@ -287,6 +485,7 @@ def get_credentials() -> Credentials:
                 # Persist refreshed token to disk
                 token_path.write_text(creds.to_json())
             if creds and creds.valid:
+                st.session_state["google_creds_obj"] = creds
                 return creds
         except Exception as e:
             print(f"Error loading credentials from session: {e}")
@@ -410,6 +609,34 @@ def get_credentials() -> Credentials:
     st.stop()
 
 
+# Service objects are cached per access token: building one parses the API
+# discovery document, which would otherwise happen on every Streamlit rerun.
+# They are shared across sessions and threads, which is safe only because
+# _execute never uses their built-in transport. Tokens rotate hourly, so the
+# ttl evicts superseded clients; max_entries is sized for concurrent users
+# (one client per token) and is only a backstop against unbounded growth.
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=64,
+    ttl=3600,
+    hash_funcs={Credentials: lambda c: c.token},
+)
+def get_drive_service(creds: Credentials):
+    """Return a Drive v3 client for *creds*."""
+    return build("drive", "v3", credentials=creds, cache_discovery=False, static_discovery=True)
+
+
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=64,
+    ttl=3600,
+    hash_funcs={Credentials: lambda c: c.token},
+)
+def get_slides_service(creds: Credentials):
+    """Return a Slides v1 client for *creds*."""
+    return build("slides", "v1", credentials=creds, cache_discovery=False, static_discovery=True)
+
+
 def copy_template_presentation(
     drive_service,
     title: str,
@@ -424,32 +651,48 @@ def copy_template_presentation(
     """
     # Use provided template_id or fall back to default
     template_to_use = template_id or TEMPLATE_PRESENTATION_ID
-    
+
+    def _copy(body: dict) -> str:
+        # files.copy is not idempotent: if a retried request had in fact
+        # succeeded, we would leave a duplicate deck behind, so never retry.
+        new_file = _execute(
+            drive_service.files().copy(
+                fileId=template_to_use,
+                body=body,
+                fields="id",
+                supportsAllDrives=True,
+            ),
+            num_retries=0,
+        )
+        return new_file["id"]
+
+    # Copy straight into the destination folder in a single call.
+    if parent_folder_id:
+        try:
+            return _copy({"name": title, "parents": [parent_folder_id]})
+        except HttpError as copy_exc:
+            # A 403/404 here usually means the destination folder is not
+            # writable or not visible to this user; fall back to copying first
+            # and moving afterwards, which still yields a deck in their Drive.
+            if copy_exc.resp.status not in (403, 404):
+                raise
+
     # Create the copy first (without parents) to avoid potential 404 errors if
     # the destination folder is not accessible. We will move it in a second
     # call using files.update.
-    new_file = (
-        drive_service.files()
-        .copy(
-            fileId=template_to_use,
-            body={"name": title},
-            fields="id",
-            supportsAllDrives=True,
-        )
-        .execute()
-    )
-
-    file_id: str = new_file["id"]
+    file_id = _copy({"name": title})
 
     # Move the new file into the destination folder if provided.
     if parent_folder_id:
         try:
-            drive_service.files().update(
-                fileId=file_id,
-                addParents=parent_folder_id,
-                supportsAllDrives=True,
-                fields="id",
-            ).execute()
+            _execute(
+                drive_service.files().update(
+                    fileId=file_id,
+                    addParents=parent_folder_id,
+                    supportsAllDrives=True,
+                    fields="id",
+                )
+            )
         except Exception as move_exc:
             # Log or surface a warning in Streamlit but don't block deck creation
             st.warning(
@@ -461,41 +704,44 @@ def copy_template_presentation(
 
 
 def replace_placeholders(slides_service, presentation_id: str, mapping: Dict[str, str]) -> None:
-    """Replace all placeholders in *mapping* inside the presentation."""
+    """Replace all template placeholders in *mapping* inside the presentation.
+
+    Each replaceAllText walks the whole deck, so entries that would replace a
+    placeholder with itself are dropped. Empty values are kept: they clear the
+    placeholder from the slide.
+    """
     requests = [
-        {
-            "replaceAllText": {
-                "containsText": {"text": ph, "matchCase": True},
-                "replaceText": mapping[ph],
-            }
-        }
-        for ph in mapping
+        {"replaceAllText": {**tmpl["replaceAllText"], "replaceText": mapping[ph]}}
+        for ph, tmpl in zip(TEMPLATE_PLACEHOLDERS, _REPLACE_REQUEST_TEMPLATE)
+        if ph in mapping and mapping[ph] != ph
     ]
-    slides_service.presentations().batchUpdate(
-        presentationId=presentation_id, body={"requests": requests}
-    ).execute()
+    if not requests:
+        return
+    _execute(
+        slides_service.presentations().batchUpdate(
+            presentationId=presentation_id, body={"requests": requests}
+        )
+    )
 
 
 def make_deck_public(drive_service, file_id: str) -> str:
     """Make the slide deck viewable by anyone with the link and return it.
 
     The additional *supportsAllDrives* flag ensures that this works even when the
-    file lives in a shared drive.
+    file lives in a shared drive. Slides URLs are stable, so the link is built
+    from *file_id* rather than fetched with a second request.
     """
 
-    drive_service.permissions().create(
-        fileId=file_id,
-        body={"role": "reader", "type": "anyone"},
-        fields="id",
-        supportsAllDrives=True,
-    ).execute()
-
-    meta = (
-        drive_service.files()
-        .get(fileId=file_id, fields="webViewLink", supportsAllDrives=True)
-        .execute()
+    _execute(
+        drive_service.permissions().create(
+            fileId=file_id,
+            body={"role": "reader", "type": "anyone"},
+            fields="id",
+            supportsAllDrives=True,
+        )
     )
-    return meta["webViewLink"]
+
+    return f"https://docs.google.com/presentation/d/{file_id}/edit?usp=sharing"
 
 
 def parse_user_content(text: str) -> Tuple[Dict[str, str], list[str]]:
@@ -506,29 +752,25 @@ def parse_user_content(text: str) -> Tuple[Dict[str, str], list[str]]:
     """
     mapping: Dict[str, str] = {}
 
-    # Pattern to match {+ [^}]+ }+
-    pattern = re.compile(r"(\{{1,}[^}]+\}{1,})\s*(.*)")
-    for idx, line in enumerate(text.splitlines()):
-        m = pattern.match(line.strip())
-        if m:
-            raw_key, val = m.groups()
-            # Normalize to double braces without extra spaces
-            inner = re.sub(r'^\{+', '', raw_key)
-            inner = re.sub(r'\}+$', '', inner).strip()
-            key = "{{" + inner + "}}"
-            if key in TEMPLATE_PLACEHOLDERS:
-                if val.strip():
-                    mapping[key] = val.strip()
-                else:
-                    # If value is on the next non-empty line, capture it.
-                    next_val = ""
-                    for nxt in text.splitlines()[idx + 1 :]:
-                        if nxt.strip():
-                            next_val = nxt.strip()
-                            break
-                    mapping[key] = next_val
-
-    missing = [ph for ph in TEMPLATE_PLACEHOLDERS if ph not in mapping]
+    # The regexes only know "\n"; normalise every separator splitlines()
+    # recognises (\r, \u2028, \x0c, ...) so line boundaries are unchanged.
+    text = "\n".join(text.splitlines())
+
+    # Single pass over the whole buffer for lines starting with {+ [^}]+ }+
+    for m in _PLACEHOLDER_LINE_RE.finditer(text):
+        # Normalize to double braces without extra spaces
+        key = "{{" + m["key"] + "}}"
+        val = m["val"]
+        if key in _PLACEHOLDERS_SET:
+            if val.strip():
+                mapping[key] = val.strip()
+            else:
+                # If value is on the next non-empty line, capture it.
+                nxt = _NEXT_LINE_RE.search(text, m.end())
+                mapping[key] = nxt.group(1).strip() if nxt else ""
+
+    # Set difference runs in C; sort back into template order for reporting.
+    missing = sorted(_PLACEHOLDERS_SET - mapping.keys(), key=_PLACEHOLDER_INDEX.__getitem__)
     return mapping, missing
 
 
@@ -618,16 +860,11 @@ else:
 st.markdown("---")  # Add separator
 
 topic = st.text_input("Enter the Topic of the Infographic:")
+prompt1, prompt2, prompt3 = step_prompts(topic)
 
 # Step 1
 st.header("Step 1: Defining Topics and Subtopics")
 
-prompt1 = f"""
-You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the following theme, define the list of topics and subtopics that need to be covered by the learners in order to completely understand and apply the theme. Create this as a list (with sublists if needed). 
-
-The topic is: {topic} 
-"""
-
 st.markdown(
     "<div style='display: flex; justify-content: flex-end; margin-bottom: -10px;'>",
     unsafe_allow_html=True,
@@ -645,10 +882,6 @@ step1_output = ""
 # Step 2
 st.header("Step 2: Define and Refine the List")
 
-prompt2 = f"""
-You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the theme {topic}, redefine the topics and subtopics generated in the previous step into 4 lessons. Create 4 lesson outlines in a logical order, limiting each lesson to 3–4 topics or subtopics that are most relevant to the theme.
-"""
-
 st.markdown(
     "<div style='display: flex; justify-content: flex-end; margin-bottom: -10px;'>",
     unsafe_allow_html=True,
@@ -666,10 +899,6 @@ step2_output = ""
 # Step 3
 st.header("Step 3: Generating Main Content")
 
-prompt3 = f"""
-You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the lessons outlined above for {topic}, create a detailed set of content that will help learners fully understand the concepts and be able to apply them. Create this content as a series of lessons set up in a logical sequence. Make use of questions, interesting facts, relevant examples and case studies to keep learners engaged.
-"""
-
 st.markdown(
     "<div style='display: flex; justify-content: flex-end; margin-bottom: -10px;'>",
     unsafe_allow_html=True,
@@ -694,187 +923,6 @@ def _esc_dbl(text: str) -> str:
     """
     return text.replace('{', '{{').replace('}', '}}')
 
-# ---------------------------------------------------------------------------
-# After STEP 3 content collection, build Step 4 prompt ----------------------
-# ---------------------------------------------------------------------------
-
-# -- Build the template/examples section and output example -----------------
-_template_examples_raw = """Templates and Examples
-Title Slide
-{{Title}}
-Max 30 Characters
-Example: Knowing Yourself
-
-{{Subtitle}}
-Max 75 Characters
-Example: Why is self awareness important and how to do it?
-
-Lesson 1: Segment Slide
-{{Lesson 1 Title}} Max 30 Characters Example: What is PICS?
-{{Lesson 1 Subtitle}} Max 450 Characters Example: PICS is a simple, powerful tool for self-reflection and building self-awareness. It helps you uncover what drives you (Passions), what excites your curiosity (Interests), what you care deeply about (Causes), and what you naturally do well (Strengths). It’s your personal compass for finding meaningful direction.
-
-Lesson 1: Explanation Slide
-{{Lesson 1 Explainer 1}} Max 240 characters Example: Instead of just reacting, you recognize “I’m thinking this” or “I’m feeling that,” and you can see how those inner states influence what you say and do. In short, it’s being conscious of yourself as an observer and actor in the moment.
-{{Lesson 1 Explainer 2}} Max 180 characters Example: Self-awareness is a lifelong journey, and the “picture of you” in your mind becomes clearer and clearer as you collect more experiences and continue on your personal journey.
-
-Lesson 1: List Slide
-{{Lesson 1 List Title}} Max 30 Characters Example: Using PICS
-{{Lesson 1 List Point 1}} Max 150 characters Example: Repeat this process at least once every month to track your personal growth.
-{{Lesson 1 List Point 2}} Max 150 characters Example: It’s fine if your answers change over time as you continue to learn about yourself.
-{{Lesson 1 List Point 3}} Max 150 characters Example: Be honest with yourself, as genuine self-reflection is the key to progress.
-{{Lesson 1 List Point 4}} Max 150 characters 
-{{Lesson 1 List Point 5}} Max 150 characters 
-{{Lesson 1 Case Title}} Max 30 Characters Example: Using PICS
-{{Lesson 1 Case Description}} Max 640 Characters Example: Maria felt adrift in her job. Using the PICS self-reflection tool, she journaled to build self-awareness. Passion: She realized she loses track of time when mentoring junior colleagues. Interest: She loves reading about sustainable farming in her free time. Cause: The lack of green spaces in her city frustrates her. Strength: Friends always ask for her help to organize trips, a natural skill for her. This exercise gave her a clearer picture of what truly drives her.
-
-Lesson 2: Segment Slide
-{{Lesson 2 Title}} Max 30 Characters Example: Aligning Actions
-{{Lesson 2 Subtitle}} Max 450 Characters Example: Now that you have your PICS, the next step is to see how your daily life matches up. This lesson is about auditing your time and commitments to ensure you're living in alignment with what truly matters to you. It's about bridging the gap between who you are and what you do.
-
-Lesson 2: Explanation Slide
-{{Lesson 2 Explainer 1}} Max 240 characters Example: Think of your values (from PICS) as a destination and your daily actions as the path. If your actions don't point toward your destination, you'll feel lost. Alignment brings a sense of purpose and reduces inner conflict.
-{{Lesson 2 Explainer 2}} Max 180 characters Example: Alignment isn't about a massive, overnight change. It starts with small shifts: choosing a hobby that matches an Interest, or dedicating one hour a week to a Cause you care about. These small steps build momentum.
-
-Lesson 2: List Slide
-{{Lesson 2 List Title}} Max 30 Characters Example: Weekly Alignment Check
-{{Lesson 2 List Point 1}} Max 150 characters Example: At the end of the week, review your calendar to see how much time was dedicated to your PICS.
-{{Lesson 2 List Point 2}} Max 150 characters Example: Identify one activity that drained you and did not align with your values.
-{{Lesson 2 List Point 3}} Max 150 characters Example: Schedule one activity in the coming week that directly fuels a Passion, Interest, or Cause.
-{{Lesson 2 List Point 4}} Max 150 characters 
-{{Lesson 2 List Point 5}} Max 150 characters 
-{{Lesson 2 Case Title}} Max 30 Characters Example: Jamal's Realignment
-{{Lesson 2 Case Description}} Max 640 Characters Example: Jamal identified 'Creative Writing' as a Passion but realized he spent all his evenings watching TV shows he didn't even like. He felt misaligned and unfulfilled. Audit: He saw 10+ hours of TV and 0 hours of writing in his week. Small Shift: He decided to replace the first 30 minutes of TV time with journaling and story-writing. Result: After a month, he had a new routine, felt more energized, and had the first chapter of a story written. This small alignment had a huge impact on his well-being.
-
-Lesson 3: Segment Slide
-{{Lesson 3 Title}} Max 30 Characters Example: Limiting Beliefs
-{{Lesson 3 Subtitle}} Max 450 Characters Example: Sometimes, the biggest obstacle to living our PICS is our own mindset. Limiting beliefs are the stories we tell ourselves about why we can't do something (e.g., "I'm not creative," or "It's too late to change"). This lesson helps you identify these internal barriers and reframe them into empowering ones.
-
-Lesson 3: Explanation Slide
-{{Lesson 3 Explainer 1}} Max 240 characters Example: A limiting belief often sounds like a fact. For example, "I'm just not good with numbers." Recognizing it as a belief—a thought you can question and change—is the first step to dismantling its power over you.
-{{Lesson 3 Explainer 2}} Max 180 characters Example: The goal isn't to never have negative thoughts. It's to build a stronger, more empowering inner voice that can challenge them. Think of it as training a mental muscle to focus on possibilities, not just obstacles.
-
-Lesson 3: List Slide
-{{Lesson 3 List Title}} Max 30 Characters Example: The 3 R's of Reframing
-{{Lesson 3 List Point 1}} Max 150 characters Example: Recognize and write down a limiting thought that holds you back.
-{{Lesson 3 List Point 2}} Max 150 characters Example: Re-examine the thought by questioning if it is 100% true and finding counter-evidence.
-{{Lesson 3 List Point 3}} Max 150 characters Example: Reframe the statement into an empowering one that focuses on your strengths.
-{{Lesson 3 List Point 4}} Max 150 characters 
-{{Lesson 3 List Point 5}} Max 150 characters 
-{{Lesson 3 Case Title}} Max 30 Characters Example: Priya's Breakthrough
-{{Lesson 3 Case Description}} Max 640 Characters Example: Priya's Cause was environmental protection, but she believed, "I'm just one person, I can't make a difference." This thought stopped her from taking any action. Identification: She recognized this thought made her feel helpless and prevented her from volunteering. Reframe: She challenged it by researching local activists and changed her belief to, "My actions can inspire others and contribute to a larger movement." Action: This new belief empowered her to join a local community garden project, where she found her contributions were valued and impactful.
-
-Lesson 4: Segment Slide
-{{Lesson 4 Title}} Max 30 Characters Example: Growth Through Feedback
-{{Lesson 4 Subtitle}} Max 450 Characters Example: Self-awareness isn't built in a vacuum. To truly understand our Strengths and blind spots, we must be open to how others see us. This lesson is about cultivating a growth mindset and learning how to seek and use constructive feedback to accelerate your personal development.
-
-Lesson 4: Explanation Slide
-{{Lesson 4 Explainer 1}} Max 240 characters Example: Think of feedback not as criticism, but as data. It's valuable information that can help you adjust your course and grow more effectively. The key is to separate the feedback from your sense of self-worth.
-{{Lesson 4 Explainer 2}} Max 180 characters Example: A growth mindset means believing your abilities can be developed through dedication and hard work. When you see challenges and feedback as opportunities to learn, you unlock your potential for continuous improvement.
-
-Lesson 4: List Slide
-{{Lesson 4 List Title}} Max 30 Characters Example: Seeking Great Feedback
-{{Lesson 4 List Point 1}} Max 150 characters Example: Be specific with your questions when asking for feedback to get actionable advice.
-{{Lesson 4 List Point 2}} Max 150 characters Example: Choose your sources carefully, asking people you trust and who have a relevant perspective.
-{{Lesson 4 List Point 3}} Max 150 characters Example: Listen to understand, not to defend, and thank the person for their input.
-{{Lesson 4 List Point 4}} Max 150 characters 
-{{Lesson 4 List Point 5}} Max 150 characters 
-{{Lesson 4 Case Title}} Max 30 Characters Example: David's Development
-{{Lesson 4 Case Description}} Max 640 Characters Example: David knew 'leadership' was one of his Strengths, but he felt he had stopped improving. He decided to actively seek feedback on it. Specific Question: He asked a trusted colleague, "What's one thing I could start or stop doing to make our project check-ins more productive for the team?" The Feedback: His colleague shared that sometimes he gets so excited he jumps in with solutions before everyone has had a chance to speak. Application: David made a conscious effort to listen first in the next meeting. Not only did the team come up with better ideas, but they also told him it was one of the most collaborative sessions they'd had.
-
-Activity Slide
-{{Activity Title}}
-Max 30 Characters
-Example: Your Challenge
-
-{{Activity Instructions}}
-Max 640 Characters
-Example: In the chat, share at least one thing that you’re really passionate about, one thing that piques your interest, one cause that you’re willing to take action on, and one strength that you’re proud of yourself for. Look at what others are sharing to get inspired!
-"""
-
-_output_example_raw = """{{Title}} Knowing Yourself
-{{Subtitle}} Why is self awareness important and how to do it?
-
-{{Lesson 1 Title}} What is PICS?
-{{Lesson 1 Subtitle}} PICS is a simple, powerful tool for self-reflection and building self-awareness. It helps you uncover what drives you (Passions), what excites your curiosity (Interests), what you care deeply about (Causes), and what you naturally do well (Strengths). It’s your personal compass for finding meaningful direction.
-{{Lesson 1 Explainer 1}} Instead of just reacting, you recognize “I’m thinking this” or “I’m feeling that,” and you can see how those inner states influence what you say and do. In short, it’s being conscious of yourself as an observer and actor in the moment.
-{{Lesson 1 Explainer 2}} Self-awareness is a lifelong journey, and the “picture of you” in your mind becomes clearer and clearer as you collect more experiences and continue on your personal journey.
-{{Lesson 1 List Title}} Using PICS
-{{Lesson 1 List Point 1}} Repeat this process at least once every month to track your personal growth.
-{{Lesson 1 List Point 2}} It’s fine if your answers change over time as you continue to learn about yourself.
-{{Lesson 1 List Point 3}} Be honest with yourself, as genuine self-reflection is the key to progress.
-{{Lesson 1 List Point 4}} 
-{{Lesson 1 List Point 5}} 
-{{Lesson 1 Case Title}} Using PICS
-{{Lesson 1 Case Description}} Maria felt adrift in her job. Using the PICS self-reflection tool, she journaled to build self-awareness. Passion: She realized she loses track of time when mentoring junior colleagues. Interest: She loves reading about sustainable farming in her free time. Cause: The lack of green spaces in her city frustrates her. Strength: Friends always ask for her help to organize trips, a natural skill for her. This exercise gave her a clearer picture of what truly drives her.
-
-{{Lesson 2 Title}} Aligning Actions
-{{Lesson 2 Subtitle}} Now that you have your PICS, the next step is to see how your daily life matches up. This lesson is about auditing your time and commitments to ensure you're living in alignment with what truly matters to you. It's about bridging the gap between who you are and what you do.
-{{Lesson 2 Explainer 1}} Think of your values (from PICS) as a destination and your daily actions as the path. If your actions don't point toward your destination, you'll feel lost. Alignment brings a sense of purpose and reduces inner conflict.
-{{Lesson 2 Explainer 2}} Alignment isn't about a massive, overnight change. It starts with small shifts: choosing a hobby that matches an Interest, or dedicating one hour a week to a Cause you care about. These small steps build momentum.
-{{Lesson 2 List Title}} Weekly Alignment Check
-{{Lesson 2 List Point 1}} At the end of the week, review your calendar to see how much time was dedicated to your PICS.
-{{Lesson 2 List Point 2}} Identify one activity that drained you and did not align with your values.
-{{Lesson 2 List Point 3}} Schedule one activity in the coming week that directly fuels a Passion, Interest, or Cause.
-{{Lesson 2 List Point 4}} Reflect on previous similar activities to inform your starting points for these activities.
-{{Lesson 2 List Point 5}} 
-{{Lesson 2 Case Title}} Jamal's Realignment
-{{Lesson 2 Case Description}} Jamal identified 'Creative Writing' as a Passion but realized he spent all his evenings watching TV shows he didn't even like. He felt misaligned and unfulfilled. Audit: He saw 10+ hours of TV and 0 hours of writing in his week. Small Shift: He decided to replace the first 30 minutes of TV time with journaling and story-writing. Result: After a month, he had a new routine, felt more energized, and had the first chapter of a story written. This small alignment had a huge impact on his well-being.
-
-{{Lesson 3 Title}} Limiting Beliefs
-{{Lesson 3 Subtitle}} Sometimes, the biggest obstacle to living our PICS is our own mindset. Limiting beliefs are the stories we tell ourselves about why we can't do something (e.g., "I'm not creative," or "It's too late to change"). This lesson helps you identify these internal barriers and reframe them into empowering ones.
-{{Lesson 3 Explainer 1}} A limiting belief often sounds like a fact. For example, "I'm just not good with numbers." Recognizing it as a belief—a thought you can question and change—is the first step to dismantling its power over you.
-{{Lesson 3 Explainer 2}} The goal isn't to never have negative thoughts. It's to build a stronger, more empowering inner voice that can challenge them. Think of it as training a mental muscle to focus on possibilities, not just obstacles.
-{{Lesson 3 List Title}} The 3 R's of Reframing
-{{Lesson 3 List Point 1}} Recognize and write down a limiting thought that holds you back.
-{{Lesson 3 List Point 2}} Re-examine the thought by questioning if it is 100% true and finding counter-evidence.
-{{Lesson 3 List Point 3}} Reframe the statement into an empowering one that focuses on your strengths.
-{{Lesson 3 List Point 4}} 
-{{Lesson 3 List Point 5}} 
-{{Lesson 3 Case Title}} Priya's Breakthrough
-{{Lesson 3 Case Description}} Priya's Cause was environmental protection, but she believed, "I'm just one person, I can't make a difference." This thought stopped her from taking any action. Identification: She recognized this thought made her feel helpless and prevented her from volunteering. Reframe: She challenged it by researching local activists and changed her belief to, "My actions can inspire others and contribute to a larger movement." Action: This new belief empowered her to join a local community garden project, where she found her contributions were valued and impactful.
-
-{{Lesson 4 Title}} Growth Through Feedback
-{{Lesson 4 Subtitle}} Self-awareness isn't built in a vacuum. To truly understand our Strengths and blind spots, we must be open to how others see us. This lesson is about cultivating a growth mindset and learning how to seek and use constructive feedback to accelerate your personal development.
-{{Lesson 4 Explainer 1}} Think of feedback not as criticism, but as data. It's valuable information that can help you adjust your course and grow more effectively. The key is to separate the feedback from your sense of self-worth.
-{{Lesson 4 Explainer 2}} A growth mindset means believing your abilities can be developed through dedication and hard work. When you see challenges and feedback as opportunities to learn, you unlock your potential for continuous improvement.
-{{Lesson 4 List Title}} Seeking Great Feedback
-{{Lesson 4 List Point 1}} Be specific with your questions when asking for feedback to get actionable advice.
-{{Lesson 4 List Point 2}} Choose your sources carefully, asking people you trust and who have a relevant perspective.
-{{Lesson 4 List Point 3}} Listen to understand, not to defend, and thank the person for their input.
-{{Lesson 4 List Point 4}} Pay attention to what they’re saying and make them feel comfortable.
-{{Lesson 4 List Point 5}} Don’t interrupt as they speak.
-{{Lesson 4 Case Title}} David's Development
-{{Lesson 4 Case Description}} David knew 'leadership' was one of his Strengths, but he felt he had stopped improving. He decided to actively seek feedback on it. Specific Question: He asked a trusted colleague, "What's one thing I could start or stop doing to make our project check-ins more productive for the team?" The Feedback: His colleague shared that sometimes he gets so excited he jumps in with solutions before everyone has had a chance to speak. Application: David made a conscious effort to listen first in the next meeting. Not only did the team come up with better ideas, but they also told him it was one of the most collaborative sessions they'd had.
-
-{{Activity Title}} Your Challenge
-{{Activity Instructions}} In the chat, share at least one thing that you’re really passionate about, one thing that piques your interest, one cause that you’re willing to take action on, and one strength that you’re proud of yourself for. Look at what others are sharing to get inspired!
-"""
-
-_template_examples = _template_examples_raw  # maintain double braces
-_output_example = _output_example_raw
-
-prompt4 = (
-    "You’re an instructional designer with experience in creating learning content for online courses designed for young adults. "
-    "The following is course content related to the topic: {{Topic}}, which is divided into 4 lessons. "
-    "Use this content to create a set of slide content that will help learners review everything from the content. "
-    "Follow these rules when creating this slide deck content, and format the output in line with the relevant slide type from the Templates and Examples Section:\n\n"
-    "Start with a “Title Slide”. This should share the topic and a quick explainer of the idea / framework / tool that will be shared.\n\n"
-    "Structure the slides in a logical manner.\n\n"
-    "You MUST strictly follow all character count limits provided in the templates (e.g., Max 240 characters). This is not a suggestion but a mandatory rule for the output. Write very concisely to ensure your responses fit within these limits. Any output that exceeds the specified character count for a field is considered incorrect.\n\n"
-    "For each lesson, start with a “Segment Slide”. This should include a question that peaks interest in the topic or poses the topic as a relatable question. This should follow a very brief description to help give context to the question, or create interest in what follows.\n\n"
-    "For each lesson, create slide content in the “Explanation Slide” format. This is where you provide a more detailed explanation of the concept, in 2 paragraphs.\n\n"
-    "For each lesson, create slide content in the “List Slide” format. This can contain further details about the lesson concept, tips, facts, or examples. For this slide, generate between 2 and 5 distinct points, with each point being a complete sentence.\n\n"
-    "For each lesson, create slide content in the “Case or Example Slide” format. This is where you can provide details of an example of case study that further explains the concepts.\n\n"
-    "At the end of the deck, add a challenge or activity that learners can use to apply, practice or reflect on their learning from the content. This needs to be a set of instructions on how to conduct the activity in the “Activity Slide” format.\n\n"
-    
-    f"{_template_examples}\n\n"
-    "Before providing the final output, perform a final check to ensure every single field's content is under its specified character limit.\n\n"
-    "Output requirements:\n"
-    "For your output, you will ONLY share each of the required {{content}} sections followed by the exact content. Use double curly braces for all placeholders, like {{Title}}:\n\n"
-    "Output Example:\n\n"
-    f"{_output_example}\n"
-)
-
 # Step 4
 st.header("Step 4: Generating Slide Content")
 
@@ -883,11 +931,11 @@ st.markdown(
     "<div style='display: flex; justify-content: flex-end; margin-bottom: -10px; margin-top: 4px;'>",
     unsafe_allow_html=True,
 )
-clipboard_button(prompt4, label="Copy Step 4 Prompt", key="p4")
+clipboard_button(STEP4_PROMPT, label="Copy Step 4 Prompt", key="p4")
 st.markdown("</div>", unsafe_allow_html=True)
 
 with st.expander("View Step 4 Prompt", expanded=False):
-    st.code(prompt4, language="text")
+    st.code(STEP4_PROMPT, language="text")
 
 # Step 5 – Paste AI output for slides
 with st.expander("5️⃣ Paste the filled-in content", expanded=True):
@@ -899,6 +947,9 @@ with st.expander("5️⃣ Paste the filled-in content", expanded=True):
 
 # Step 6 – Generate the slide deck
 if st.button("Generate Slide Deck", disabled=not user_input.strip()):
+    # Single timestamp for this build, shared by every deck-title branch
+    now = time.gmtime()
+
     with st.spinner("Parsing content…"):
         placeholder_map, missing = parse_user_content(user_input)
 
@@ -912,18 +963,18 @@ if st.button("Generate Slide Deck", disabled=not user_input.strip()):
     try:
         with st.spinner("Authorizing with Google…"):
             creds = get_credentials()
-            drive_svc = build("drive", "v3", credentials=creds)
-            slides_svc = build("slides", "v1", credentials=creds)
+            drive_svc = get_drive_service(creds)
+            slides_svc = get_slides_service(creds)
 
         with st.spinner("Copying template deck…"):
             # Use the topic as the slide deck title; if blank, fall back to a timestamped title
             title_placeholder = placeholder_map.get("{{Title}}", "").strip()
             if title_placeholder:
-                deck_title = f"{title_placeholder} | {datetime.datetime.now(datetime.UTC):%Y-%m-%d}"
+                deck_title = f"{title_placeholder} | {time.strftime('%Y-%m-%d', now)}"
             elif topic.strip():
-                deck_title = f"{topic.strip()} | {datetime.datetime.now(datetime.UTC):%Y-%m-%d}"
+                deck_title = f"{topic.strip()} | {time.strftime('%Y-%m-%d', now)}"
             else:
-                deck_title = f"Tuesday Tips – {datetime.datetime.now(datetime.UTC):%Y-%m-%d %H:%M:%S}"
+                deck_title = f"Tuesday Tips – {time.strftime('%Y-%m-%d %H:%M:%S', now)}"
             
             # Get selected template from session state
             selected_template_key = st.session_state.get("selected_template", "Template Version 1")
@@ -934,6 +985,8 @@ if st.button("Generate Slide Deck", disabled=not user_input.strip()):
         with st.spinner("Replacing placeholders…"):
             replace_placeholders(slides_svc, new_id, placeholder_map)
 
+        # Publish only once the content is in place, so a failed replacement
+        # never leaves a public deck full of raw placeholders.
         with st.spinner("Publishing deck…"):
             share_link = make_deck_public(drive_svc, new_id)
 
@@ -949,6 +1002,8 @@ if st.button("Generate Slide Deck", disabled=not user_input.strip()):
     st.session_state["share_link"] = share_link
     st.session_state["deck_title"] = deck_title
     st.session_state["title_placeholder"] = title_placeholder
+    # Drop any images ZIP built for a previous deck
+    st.session_state.pop("zip_data", None)
 
     # Inform user to use buttons below
     st.info("Use the buttons below to open the slides, open the folder, or download images.")
@@ -967,11 +1022,13 @@ if "deck_id" in st.session_state:
 
     st.markdown("### Your Slide Deck")
 
-    # Embed the deck
-    st.components.v1.html(
-        f"<iframe src='{share_link}' width='100%' height='600' allowfullscreen frameborder='0'></iframe>",
-        height=600,
-    )
+    # Embed the deck only on request: the Slides viewer pulls in several MB of
+    # third-party assets, which otherwise load on every rerun.
+    if st.checkbox("Show deck preview", value=False, key="show_deck_preview"):
+        st.components.v1.html(
+            f"<iframe src='{share_link}' width='100%' height='600' loading='lazy' allowfullscreen frameborder='0'></iframe>",
+            height=600,
+        )
 
     folder_url = f"https://drive.google.com/drive/folders/{DESTINATION_FOLDER_ID}"
 
@@ -997,23 +1054,24 @@ if "deck_id" in st.session_state:
             )
 
     with col3:
-        if "zip_ready" not in st.session_state:
-            if st.button("Download Images"):
+        # Generate and offer the ZIP in the same run, so no extra full-script
+        # rerun is needed between the two clicks.
+        if "zip_data" not in st.session_state:
+            if st.button("Download Images", key="gen_zip"):
                 with st.spinner("Generating images…"):
                     try:
                         creds = get_credentials()
-                        slides_svc = build("slides", "v1", credentials=creds)
-                        zip_buf = build_slide_images_zip(creds, slides_svc, deck_id)
-                        st.session_state["zip_data"] = zip_buf.getvalue()
-                        st.session_state["zip_ready"] = True
-                        _rerun()
+                        slides_svc = get_slides_service(creds)
+                        st.session_state["zip_data"] = build_slide_images_zip(
+                            creds, slides_svc, deck_id
+                        )
                     except Exception as img_exc:
                         st.error(f"Could not generate slide images: {img_exc}")
-        else:
+        if "zip_data" in st.session_state:
             st.download_button(
                 label="Click to download ZIP",
                 data=st.session_state["zip_data"],
                 file_name=f"{title_placeholder or deck_title.split('|')[0].strip()} | Tuesday Tips Images.zip",
                 mime="application/zip",
                 key="download_zip_btn2",
-            ) 
\ No newline at end of file
+            )
@@ -1,10 +1,14 @@
 # Download Images
 import re
+import string
 import streamlit as st
-from googleapiclient.discovery import build
 
 # Import utilities from the main app
-from generate_infographic import build_slide_images_zip, get_credentials
+from generate_infographic import build_slide_images_zip, get_credentials, get_slides_service
+
+# Matches the …/d/{presentationId}/… segment of a Slides URL
+_PRES_ID_RE = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+_PRES_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 st.set_page_config(page_title="Download Images", page_icon="⬇️", layout="centered")
 
@@ -28,8 +32,15 @@ def _extract_presentation_id(url_or_id: str) -> str:
     if "/" not in url_or_id and len(url_or_id) >= 25:
         return url_or_id
 
-    # Try to pull the ID from a typical URL pattern …/d/{presentationId}/…
-    match = re.search(r"/d/([a-zA-Z0-9_-]+)", url_or_id)
+    # Fast path for the typical URL pattern …/d/{presentationId}/…
+    _, sep, rest = url_or_id.partition("/d/")
+    if sep:
+        candidate = rest.partition("/")[0].partition("?")[0]
+        if candidate and _PRES_ID_CHARS.issuperset(candidate):
+            return candidate
+
+    # Fall back to the regex for anything less regular
+    match = _PRES_ID_RE.search(url_or_id)
     if match:
         return match.group(1)
 
@@ -49,9 +60,8 @@ if st.button("Download Images", disabled=not slide_link.strip()):
         pres_id = _extract_presentation_id(slide_link)
         with st.spinner("Generating slide thumbnails…"):
             creds = get_credentials()
-            slides_svc = build("slides", "v1", credentials=creds)
-            zip_buf = build_slide_images_zip(creds, slides_svc, pres_id)
-            st.session_state["img_zip"] = zip_buf.getvalue()
+            slides_svc = get_slides_service(creds)
+            st.session_state["img_zip"] = build_slide_images_zip(creds, slides_svc, pres_id)
     except Exception as exc:
         st.error(f"⚠️ Could not generate images: {exc}")
 
@@ -0,0 +1,202 @@
+# Prompt text for the Generate Infographic steps
+#
+# Kept in its own module because Streamlit re-executes the main script on
+# every widget interaction, while imported modules are only loaded once.
+import functools
+from typing import Tuple
+
+TEMPLATE_EXAMPLES = """Templates and Examples
+Title Slide
+{{Title}}
+Max 30 Characters
+Example: Knowing Yourself
+
+{{Subtitle}}
+Max 75 Characters
+Example: Why is self awareness important and how to do it?
+
+Lesson 1: Segment Slide
+{{Lesson 1 Title}} Max 30 Characters Example: What is PICS?
+{{Lesson 1 Subtitle}} Max 450 Characters Example: PICS is a simple, powerful tool for self-reflection and building self-awareness. It helps you uncover what drives you (Passions), what excites your curiosity (Interests), what you care deeply about (Causes), and what you naturally do well (Strengths). It’s your personal compass for finding meaningful direction.
+
+Lesson 1: Explanation Slide
+{{Lesson 1 Explainer 1}} Max 240 characters Example: Instead of just reacting, you recognize “I’m thinking this” or “I’m feeling that,” and you can see how those inner states influence what you say and do. In short, it’s being conscious of yourself as an observer and actor in the moment.
+{{Lesson 1 Explainer 2}} Max 180 characters Example: Self-awareness is a lifelong journey, and the “picture of you” in your mind becomes clearer and clearer as you collect more experiences and continue on your personal journey.
+
+Lesson 1: List Slide
+{{Lesson 1 List Title}} Max 30 Characters Example: Using PICS
+{{Lesson 1 List Point 1}} Max 150 characters Example: Repeat this process at least once every month to track your personal growth.
+{{Lesson 1 List Point 2}} Max 150 characters Example: It’s fine if your answers change over time as you continue to learn about yourself.
+{{Lesson 1 List Point 3}} Max 150 characters Example: Be honest with yourself, as genuine self-reflection is the key to progress.
+{{Lesson 1 List Point 4}} Max 150 characters 
+{{Lesson 1 List Point 5}} Max 150 characters 
+{{Lesson 1 Case Title}} Max 30 Characters Example: Using PICS
+{{Lesson 1 Case Description}} Max 640 Characters Example: Maria felt adrift in her job. Using the PICS self-reflection tool, she journaled to build self-awareness. Passion: She realized she loses track of time when mentoring junior colleagues. Interest: She loves reading about sustainable farming in her free time. Cause: The lack of green spaces in her city frustrates her. Strength: Friends always ask for her help to organize trips, a natural skill for her. This exercise gave her a clearer picture of what truly drives her.
+
+Lesson 2: Segment Slide
+{{Lesson 2 Title}} Max 30 Characters Example: Aligning Actions
+{{Lesson 2 Subtitle}} Max 450 Characters Example: Now that you have your PICS, the next step is to see how your daily life matches up. This lesson is about auditing your time and commitments to ensure you're living in alignment with what truly matters to you. It's about bridging the gap between who you are and what you do.
+
+Lesson 2: Explanation Slide
+{{Lesson 2 Explainer 1}} Max 240 characters Example: Think of your values (from PICS) as a destination and your daily actions as the path. If your actions don't point toward your destination, you'll feel lost. Alignment brings a sense of purpose and reduces inner conflict.
+{{Lesson 2 Explainer 2}} Max 180 characters Example: Alignment isn't about a massive, overnight change. It starts with small shifts: choosing a hobby that matches an Interest, or dedicating one hour a week to a Cause you care about. These small steps build momentum.
+
+Lesson 2: List Slide
+{{Lesson 2 List Title}} Max 30 Characters Example: Weekly Alignment Check
+{{Lesson 2 List Point 1}} Max 150 characters Example: At the end of the week, review your calendar to see how much time was dedicated to your PICS.
+{{Lesson 2 List Point 2}} Max 150 characters Example: Identify one activity that drained you and did not align with your values.
+{{Lesson 2 List Point 3}} Max 150 characters Example: Schedule one activity in the coming week that directly fuels a Passion, Interest, or Cause.
+{{Lesson 2 List Point 4}} Max 150 characters 
+{{Lesson 2 List Point 5}} Max 150 characters 
+{{Lesson 2 Case Title}} Max 30 Characters Example: Jamal's Realignment
+{{Lesson 2 Case Description}} Max 640 Characters Example: Jamal identified 'Creative Writing' as a Passion but realized he spent all his evenings watching TV shows he didn't even like. He felt misaligned and unfulfilled. Audit: He saw 10+ hours of TV and 0 hours of writing in his week. Small Shift: He decided to replace the first 30 minutes of TV time with journaling and story-writing. Result: After a month, he had a new routine, felt more energized, and had the first chapter of a story written. This small alignment had a huge impact on his well-being.
+
+Lesson 3: Segment Slide
+{{Lesson 3 Title}} Max 30 Characters Example: Limiting Beliefs
+{{Lesson 3 Subtitle}} Max 450 Characters Example: Sometimes, the biggest obstacle to living our PICS is our own mindset. Limiting beliefs are the stories we tell ourselves about why we can't do something (e.g., "I'm not creative," or "It's too late to change"). This lesson helps you identify these internal barriers and reframe them into empowering ones.
+
+Lesson 3: Explanation Slide
+{{Lesson 3 Explainer 1}} Max 240 characters Example: A limiting belief often sounds like a fact. For example, "I'm just not good with numbers." Recognizing it as a belief—a thought you can question and change—is the first step to dismantling its power over you.
+{{Lesson 3 Explainer 2}} Max 180 characters Example: The goal isn't to never have negative thoughts. It's to build a stronger, more empowering inner voice that can challenge them. Think of it as training a mental muscle to focus on possibilities, not just obstacles.
+
+Lesson 3: List Slide
+{{Lesson 3 List Title}} Max 30 Characters Example: The 3 R's of Reframing
+{{Lesson 3 List Point 1}} Max 150 characters Example: Recognize and write down a limiting thought that holds you back.
+{{Lesson 3 List Point 2}} Max 150 characters Example: Re-examine the thought by questioning if it is 100% true and finding counter-evidence.
+{{Lesson 3 List Point 3}} Max 150 characters Example: Reframe the statement into an empowering one that focuses on your strengths.
+{{Lesson 3 List Point 4}} Max 150 characters 
+{{Lesson 3 List Point 5}} Max 150 characters 
+{{Lesson 3 Case Title}} Max 30 Characters Example: Priya's Breakthrough
+{{Lesson 3 Case Description}} Max 640 Characters Example: Priya's Cause was environmental protection, but she believed, "I'm just one person, I can't make a difference." This thought stopped her from taking any action. Identification: She recognized this thought made her feel helpless and prevented her from volunteering. Reframe: She challenged it by researching local activists and changed her belief to, "My actions can inspire others and contribute to a larger movement." Action: This new belief empowered her to join a local community garden project, where she found her contributions were valued and impactful.
+
+Lesson 4: Segment Slide
+{{Lesson 4 Title}} Max 30 Characters Example: Growth Through Feedback
+{{Lesson 4 Subtitle}} Max 450 Characters Example: Self-awareness isn't built in a vacuum. To truly understand our Strengths and blind spots, we must be open to how others see us. This lesson is about cultivating a growth mindset and learning how to seek and use constructive feedback to accelerate your personal development.
+
+Lesson 4: Explanation Slide
+{{Lesson 4 Explainer 1}} Max 240 characters Example: Think of feedback not as criticism, but as data. It's valuable information that can help you adjust your course and grow more effectively. The key is to separate the feedback from your sense of self-worth.
+{{Lesson 4 Explainer 2}} Max 180 characters Example: A growth mindset means believing your abilities can be developed through dedication and hard work. When you see challenges and feedback as opportunities to learn, you unlock your potential for continuous improvement.
+
+Lesson 4: List Slide
+{{Lesson 4 List Title}} Max 30 Characters Example: Seeking Great Feedback
+{{Lesson 4 List Point 1}} Max 150 characters Example: Be specific with your questions when asking for feedback to get actionable advice.
+{{Lesson 4 List Point 2}} Max 150 characters Example: Choose your sources carefully, asking people you trust and who have a relevant perspective.
+{{Lesson 4 List Point 3}} Max 150 characters Example: Listen to understand, not to defend, and thank the person for their input.
+{{Lesson 4 List Point 4}} Max 150 characters 
+{{Lesson 4 List Point 5}} Max 150 characters 
+{{Lesson 4 Case Title}} Max 30 Characters Example: David's Development
+{{Lesson 4 Case Description}} Max 640 Characters Example: David knew 'leadership' was one of his Strengths, but he felt he had stopped improving. He decided to actively seek feedback on it. Specific Question: He asked a trusted colleague, "What's one thing I could start or stop doing to make our project check-ins more productive for the team?" The Feedback: His colleague shared that sometimes he gets so excited he jumps in with solutions before everyone has had a chance to speak. Application: David made a conscious effort to listen first in the next meeting. Not only did the team come up with better ideas, but they also told him it was one of the most collaborative sessions they'd had.
+
+Activity Slide
+{{Activity Title}}
+Max 30 Characters
+Example: Your Challenge
+
+{{Activity Instructions}}
+Max 640 Characters
+Example: In the chat, share at least one thing that you’re really passionate about, one thing that piques your interest, one cause that you’re willing to take action on, and one strength that you’re proud of yourself for. Look at what others are sharing to get inspired!
+"""
+
+OUTPUT_EXAMPLE = """{{Title}} Knowing Yourself
+{{Subtitle}} Why is self awareness important and how to do it?
+
+{{Lesson 1 Title}} What is PICS?
+{{Lesson 1 Subtitle}} PICS is a simple, powerful tool for self-reflection and building self-awareness. It helps you uncover what drives you (Passions), what excites your curiosity (Interests), what you care deeply about (Causes), and what you naturally do well (Strengths). It’s your personal compass for finding meaningful direction.
+{{Lesson 1 Explainer 1}} Instead of just reacting, you recognize “I’m thinking this” or “I’m feeling that,” and you can see how those inner states influence what you say and do. In short, it’s being conscious of yourself as an observer and actor in the moment.
+{{Lesson 1 Explainer 2}} Self-awareness is a lifelong journey, and the “picture of you” in your mind becomes clearer and clearer as you collect more experiences and continue on your personal journey.
+{{Lesson 1 List Title}} Using PICS
+{{Lesson 1 List Point 1}} Repeat this process at least once every month to track your personal growth.
+{{Lesson 1 List Point 2}} It’s fine if your answers change over time as you continue to learn about yourself.
+{{Lesson 1 List Point 3}} Be honest with yourself, as genuine self-reflection is the key to progress.
+{{Lesson 1 List Point 4}} 
+{{Lesson 1 List Point 5}} 
+{{Lesson 1 Case Title}} Using PICS
+{{Lesson 1 Case Description}} Maria felt adrift in her job. Using the PICS self-reflection tool, she journaled to build self-awareness. Passion: She realized she loses track of time when mentoring junior colleagues. Interest: She loves reading about sustainable farming in her free time. Cause: The lack of green spaces in her city frustrates her. Strength: Friends always ask for her help to organize trips, a natural skill for her. This exercise gave her a clearer picture of what truly drives her.
+
+{{Lesson 2 Title}} Aligning Actions
+{{Lesson 2 Subtitle}} Now that you have your PICS, the next step is to see how your daily life matches up. This lesson is about auditing your time and commitments to ensure you're living in alignment with what truly matters to you. It's about bridging the gap between who you are and what you do.
+{{Lesson 2 Explainer 1}} Think of your values (from PICS) as a destination and your daily actions as the path. If your actions don't point toward your destination, you'll feel lost. Alignment brings a sense of purpose and reduces inner conflict.
+{{Lesson 2 Explainer 2}} Alignment isn't about a massive, overnight change. It starts with small shifts: choosing a hobby that matches an Interest, or dedicating one hour a week to a Cause you care about. These small steps build momentum.
+{{Lesson 2 List Title}} Weekly Alignment Check
+{{Lesson 2 List Point 1}} At the end of the week, review your calendar to see how much time was dedicated to your PICS.
+{{Lesson 2 List Point 2}} Identify one activity that drained you and did not align with your values.
+{{Lesson 2 List Point 3}} Schedule one activity in the coming week that directly fuels a Passion, Interest, or Cause.
+{{Lesson 2 List Point 4}} Reflect on previous similar activities to inform your starting points for these activities.
+{{Lesson 2 List Point 5}} 
+{{Lesson 2 Case Title}} Jamal's Realignment
+{{Lesson 2 Case Description}} Jamal identified 'Creative Writing' as a Passion but realized he spent all his evenings watching TV shows he didn't even like. He felt misaligned and unfulfilled. Audit: He saw 10+ hours of TV and 0 hours of writing in his week. Small Shift: He decided to replace the first 30 minutes of TV time with journaling and story-writing. Result: After a month, he had a new routine, felt more energized, and had the first chapter of a story written. This small alignment had a huge impact on his well-being.
+
+{{Lesson 3 Title}} Limiting Beliefs
+{{Lesson 3 Subtitle}} Sometimes, the biggest obstacle to living our PICS is our own mindset. Limiting beliefs are the stories we tell ourselves about why we can't do something (e.g., "I'm not creative," or "It's too late to change"). This lesson helps you identify these internal barriers and reframe them into empowering ones.
+{{Lesson 3 Explainer 1}} A limiting belief often sounds like a fact. For example, "I'm just not good with numbers." Recognizing it as a belief—a thought you can question and change—is the first step to dismantling its power over you.
+{{Lesson 3 Explainer 2}} The goal isn't to never have negative thoughts. It's to build a stronger, more empowering inner voice that can challenge them. Think of it as training a mental muscle to focus on possibilities, not just obstacles.
+{{Lesson 3 List Title}} The 3 R's of Reframing
+{{Lesson 3 List Point 1}} Recognize and write down a limiting thought that holds you back.
+{{Lesson 3 List Point 2}} Re-examine the thought by questioning if it is 100% true and finding counter-evidence.
+{{Lesson 3 List Point 3}} Reframe the statement into an empowering one that focuses on your strengths.
+{{Lesson 3 List Point 4}} 
+{{Lesson 3 List Point 5}} 
+{{Lesson 3 Case Title}} Priya's Breakthrough
+{{Lesson 3 Case Description}} Priya's Cause was environmental protection, but she believed, "I'm just one person, I can't make a difference." This thought stopped her from taking any action. Identification: She recognized this thought made her feel helpless and prevented her from volunteering. Reframe: She challenged it by researching local activists and changed her belief to, "My actions can inspire others and contribute to a larger movement." Action: This new belief empowered her to join a local community garden project, where she found her contributions were valued and impactful.
+
+{{Lesson 4 Title}} Growth Through Feedback
+{{Lesson 4 Subtitle}} Self-awareness isn't built in a vacuum. To truly understand our Strengths and blind spots, we must be open to how others see us. This lesson is about cultivating a growth mindset and learning how to seek and use constructive feedback to accelerate your personal development.
+{{Lesson 4 Explainer 1}} Think of feedback not as criticism, but as data. It's valuable information that can help you adjust your course and grow more effectively. The key is to separate the feedback from your sense of self-worth.
+{{Lesson 4 Explainer 2}} A growth mindset means believing your abilities can be developed through dedication and hard work. When you see challenges and feedback as opportunities to learn, you unlock your potential for continuous improvement.
+{{Lesson 4 List Title}} Seeking Great Feedback
+{{Lesson 4 List Point 1}} Be specific with your questions when asking for feedback to get actionable advice.
+{{Lesson 4 List Point 2}} Choose your sources carefully, asking people you trust and who have a relevant perspective.
+{{Lesson 4 List Point 3}} Listen to understand, not to defend, and thank the person for their input.
+{{Lesson 4 List Point 4}} Pay attention to what they’re saying and make them feel comfortable.
+{{Lesson 4 List Point 5}} Don’t interrupt as they speak.
+{{Lesson 4 Case Title}} David's Development
+{{Lesson 4 Case Description}} David knew 'leadership' was one of his Strengths, but he felt he had stopped improving. He decided to actively seek feedback on it. Specific Question: He asked a trusted colleague, "What's one thing I could start or stop doing to make our project check-ins more productive for the team?" The Feedback: His colleague shared that sometimes he gets so excited he jumps in with solutions before everyone has had a chance to speak. Application: David made a conscious effort to listen first in the next meeting. Not only did the team come up with better ideas, but they also told him it was one of the most collaborative sessions they'd had.
+
+{{Activity Title}} Your Challenge
+{{Activity Instructions}} In the chat, share at least one thing that you’re really passionate about, one thing that piques your interest, one cause that you’re willing to take action on, and one strength that you’re proud of yourself for. Look at what others are sharing to get inspired!
+"""
+
+
+# The Step 4 prompt does not depend on the topic (it keeps a literal {{Topic}}
+# placeholder), so it is assembled once at import.
+STEP4_PROMPT = (
+    "You’re an instructional designer with experience in creating learning content for online courses designed for young adults. "
+    "The following is course content related to the topic: {{Topic}}, which is divided into 4 lessons. "
+    "Use this content to create a set of slide content that will help learners review everything from the content. "
+    "Follow these rules when creating this slide deck content, and format the output in line with the relevant slide type from the Templates and Examples Section:\n\n"
+    "Start with a “Title Slide”. This should share the topic and a quick explainer of the idea / framework / tool that will be shared.\n\n"
+    "Structure the slides in a logical manner.\n\n"
+    "You MUST strictly follow all character count limits provided in the templates (e.g., Max 240 characters). This is not a suggestion but a mandatory rule for the output. Write very concisely to ensure your responses fit within these limits. Any output that exceeds the specified character count for a field is considered incorrect.\n\n"
+    "For each lesson, start with a “Segment Slide”. This should include a question that peaks interest in the topic or poses the topic as a relatable question. This should follow a very brief description to help give context to the question, or create interest in what follows.\n\n"
+    "For each lesson, create slide content in the “Explanation Slide” format. This is where you provide a more detailed explanation of the concept, in 2 paragraphs.\n\n"
+    "For each lesson, create slide content in the “List Slide” format. This can contain further details about the lesson concept, tips, facts, or examples. For this slide, generate between 2 and 5 distinct points, with each point being a complete sentence.\n\n"
+    "For each lesson, create slide content in the “Case or Example Slide” format. This is where you can provide details of an example of case study that further explains the concepts.\n\n"
+    "At the end of the deck, add a challenge or activity that learners can use to apply, practice or reflect on their learning from the content. This needs to be a set of instructions on how to conduct the activity in the “Activity Slide” format.\n\n"
+    
+    f"{TEMPLATE_EXAMPLES}\n\n"
+    "Before providing the final output, perform a final check to ensure every single field's content is under its specified character limit.\n\n"
+    "Output requirements:\n"
+    "For your output, you will ONLY share each of the required {{content}} sections followed by the exact content. Use double curly braces for all placeholders, like {{Title}}:\n\n"
+    "Output Example:\n\n"
+    f"{OUTPUT_EXAMPLE}\n"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def step_prompts(topic: str) -> Tuple[str, str, str]:
+    """Return the Step 1–3 prompts for *topic*."""
+    prompt1 = f"""
+You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the following theme, define the list of topics and subtopics that need to be covered by the learners in order to completely understand and apply the theme. Create this as a list (with sublists if needed). 
+
+The topic is: {topic} 
+"""
+
+    prompt2 = f"""
+You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the theme {topic}, redefine the topics and subtopics generated in the previous step into 4 lessons. Create 4 lesson outlines in a logical order, limiting each lesson to 3–4 topics or subtopics that are most relevant to the theme.
+"""
+
+    prompt3 = f"""
+You’re an instructional designer with experience in creating learning content for online courses designed for young adults. For the lessons outlined above for {topic}, create a detailed set of content that will help learners fully understand the concepts and be able to apply them. Create this content as a series of lessons set up in a logical sequence. Make use of questions, interesting facts, relevant examples and case studies to keep learners engaged.
+"""
+
+    return prompt1, prompt2, prompt3